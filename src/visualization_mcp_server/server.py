@@ -1,160 +1,415 @@
-import matplotlib.pyplot as plt
+import os
+import tempfile
+
+# Point matplotlib at a writable config dir before it is imported, so the
+# font cache persists across runs instead of being rebuilt at first plot
+os.environ.setdefault("MPLCONFIGDIR", os.path.join(tempfile.gettempdir(), "mpl-visualization-mcp"))
+os.makedirs(os.environ["MPLCONFIGDIR"], exist_ok=True)
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import ListedColormap, Normalize
+from matplotlib.cm import ScalarMappable
+from matplotlib.lines import Line2D
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.animation import FuncAnimation
 import numpy as np
 import pandas as pd
 import networkx as nx
 from typing import Any, List, Optional, Union
+from contextlib import contextmanager
+import asyncio
+import collections
+import functools
+import hashlib
 import json
+import threading
+import warnings
 import io
 import base64
 from datetime import datetime
+from PIL import Image as PILImage
 from mcp.server.fastmcp import FastMCP, Image
 
+# Optional SIMD PNG encoder - ~5-10x faster than Pillow when installed
+try:
+    import fpnge
+    _HAVE_FPNGE = True
+except ImportError:
+    _HAVE_FPNGE = False
+
+# Set VIS_PNG_ENCODER to "fpnge" or "pillow" to force a backend
+_PNG_ENCODER = os.environ.get("VIS_PNG_ENCODER", "").lower()
+
+# scipy unlocks sparse solvers in networkx layout algorithms
+try:
+    import scipy.sparse  # noqa: F401
+    _HAVE_SCIPY = True
+except ImportError:
+    _HAVE_SCIPY = False
+
+# Render DPI - pixel count (and thus draw + encode cost) scales as dpi^2,
+# so the default favours chat-UI-sized output; override with VIS_DPI
+_DEFAULT_DPI = int(os.environ.get("VIS_DPI", "100"))
+
+# Scatter tools subsample down to this many points - past it the extra
+# markers are overplotted pixels that Agg still has to draw one by one
+_MAX_POINTS = int(os.environ.get("VIS_MAX_POINTS", "50000"))
+
 # Initialize FastMCP server
 mcp = FastMCP("visualization")
 
-def get_plot_as_image(title: str = "plot") -> Image:
-    """Convert the current plot to base64-encoded PNG and return as Image."""
-    # Save plot to bytes buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-    buf.seek(0)
-    
-    # Get bytes data
-    image_bytes = buf.read()
-    buf.close()
-    plt.close()
-    
+# Pools of persistent figures keyed by figsize - creating a fresh figure
+# (and Agg renderer) on every request is the dominant cost for small
+# plots. Pools rather than single figures so concurrent renders never
+# share a Figure.
+_FIG_CACHE = {}
+_FIG_LOCK = threading.Lock()
+
+# Agg rasterization and PNG encoding release the GIL inside C code, so
+# rendering in threads overlaps across cores; the semaphore stops us
+# from oversubscribing the CPUs
+_RENDER_SEM = asyncio.Semaphore(max(1, os.cpu_count() or 1))
+
+# Finished PNGs keyed by (tool, args) hash - dashboards and chat UIs
+# re-request identical plots often enough that skipping the render
+# outright is the biggest win available. VIS_CACHE=0 disables it.
+_CACHE_ENABLED = os.environ.get("VIS_CACHE", "1") != "0"
+_PNG_CACHE = collections.OrderedDict()
+_PNG_CACHE_MAX = 64
+_PNG_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(tool: str, args: tuple) -> str:
+    payload = json.dumps([tool, args], separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def _render(func, *args) -> Image:
+    """Run a blocking render function off the event loop, with PNG caching."""
+    key = None
+    if _CACHE_ENABLED:
+        key = _cache_key(func.__name__, args)
+        with _PNG_CACHE_LOCK:
+            cached = _PNG_CACHE.get(key)
+            if cached is not None:
+                _PNG_CACHE.move_to_end(key)
+                return Image(data=cached, format="png")
+
+    async with _RENDER_SEM:
+        image = await asyncio.to_thread(func, *args)
+
+    if key is not None:
+        with _PNG_CACHE_LOCK:
+            _PNG_CACHE[key] = image.data
+            _PNG_CACHE.move_to_end(key)
+            while len(_PNG_CACHE) > _PNG_CACHE_MAX:
+                _PNG_CACHE.popitem(last=False)
+    return image
+
+
+def _prewarm() -> None:
+    """Build the font cache and warm the Agg pipeline at import time.
+
+    Without this, the first tool call pays for font enumeration and the
+    initial renderer setup, inflating p99 latency.
+    """
+    import matplotlib.font_manager
+    matplotlib.font_manager.fontManager  # triggers font cache build if missing
+    fig = Figure(figsize=(1, 1))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.set_title("warmup")
+    fig.canvas.draw()
+
+
+_prewarm()
+
+
+@contextmanager
+def acquire_fig(figsize):
+    """Yield a cleared, pooled Figure for the given figsize."""
+    with _FIG_LOCK:
+        pool = _FIG_CACHE.setdefault(figsize, [])
+        fig = pool.pop() if pool else None
+    if fig is None:
+        # Plain Figure + Agg canvas, no pyplot state or figure manager.
+        # The tight layout engine runs during the single render pass,
+        # unlike bbox_inches='tight' which forces a second full draw.
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        fig.set_layout_engine('tight')
+    fig.clear()
+    try:
+        yield fig
+    finally:
+        with _FIG_LOCK:
+            pool = _FIG_CACHE.setdefault(figsize, [])
+            if len(pool) < 4:
+                pool.append(fig)
+
+
+def _decode_or_convert(values, b64: Optional[str], name: str, dtype=np.float64) -> "np.ndarray":
+    """Return numeric input as an ndarray, preferring the binary form.
+
+    A base64-encoded little-endian float32 buffer decodes with a single
+    memcpy, versus one PyFloat unboxing per element for a JSON list.
+    """
+    if b64 is not None:
+        return np.frombuffer(base64.b64decode(b64), dtype='<f4')
+    if values is None:
+        raise ValueError(f"{name} or {name}_b64 is required")
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+@functools.lru_cache(maxsize=32)
+def _palette(name: str, k: int) -> "np.ndarray":
+    """Return k evenly spaced colors from the named colormap, cached."""
+    return matplotlib.colormaps[name](np.linspace(0, 1, k))
+
+
+def get_plot_as_image(fig, dpi: Optional[int] = None) -> Image:
+    """Render a figure to a PNG and return as Image."""
+    # Rasterize once with Agg and grab the raw RGBA pixels
+    fig.set_dpi(dpi if dpi is not None else _DEFAULT_DPI)
+    fig.canvas.draw()
+    width, height = fig.canvas.get_width_height()
+    arr = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8).reshape(height, width, 4)
+
+    image_bytes = _encode_png(arr)
+    fig.clear()
+
     # Return as Image
     return Image(data=image_bytes, format="png")
 
+
+# Recycled BytesIO buffers for PNG assembly - reusing an already-grown
+# bytearray avoids repeated reallocations during each encode. Lock-guarded
+# like the other shared pools, since renders run on worker threads.
+_BUF_POOL = []
+_BUF_LOCK = threading.Lock()
+
+
+def _get_buf() -> io.BytesIO:
+    with _BUF_LOCK:
+        return _BUF_POOL.pop() if _BUF_POOL else io.BytesIO()
+
+
+def _put_buf(buf: io.BytesIO) -> None:
+    buf.seek(0)
+    buf.truncate(0)
+    with _BUF_LOCK:
+        if len(_BUF_POOL) < 4:
+            _BUF_POOL.append(buf)
+
+
+def _encode_png(arr: "np.ndarray") -> bytes:
+    """Encode an RGBA uint8 array to PNG bytes with the fastest available backend."""
+    if _HAVE_FPNGE and _PNG_ENCODER != "pillow":
+        return fpnge.fromMat(arr)
+
+    # Pillow fallback at a low deflate level - much faster than
+    # Matplotlib's PNG writer for a marginally larger file
+    buf = _get_buf()
+    PILImage.fromarray(arr, 'RGBA').save(buf, format='PNG', compress_level=1, optimize=False)
+    image_bytes = buf.getvalue()
+    _put_buf(buf)
+    return image_bytes
+
 @mcp.tool()
 async def create_relationship_graph(
-    nodes: List[str], 
-    edges: List[List[str]], 
+    nodes: List[str],
+    edges: List[List[str]],
     title: str = "Relationship Graph",
     node_size: int = 1000,
     font_size: int = 12
 ) -> Image:
     """Create a directed relationship graph."""
+    return await _render(_create_relationship_graph, nodes, edges, title, node_size, font_size)
+
+
+def _create_relationship_graph(nodes, edges, title, node_size, font_size) -> Image:
     try:
         G = nx.DiGraph()
         G.add_nodes_from(nodes)
         for edge in edges:
             if len(edge) >= 2:
                 G.add_edge(edge[0], edge[1])
-        
-        plt.figure(figsize=(10, 8))
-        pos = nx.spring_layout(G, k=2, iterations=50)
-        nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=node_size, alpha=0.8)
-        nx.draw_networkx_edges(G, pos, edge_color='gray', arrows=True, arrowsize=20, arrowstyle='->')
-        nx.draw_networkx_labels(G, pos, font_size=font_size, font_weight='bold')
-        
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.axis('off')
-        plt.tight_layout()
-        
-        return get_plot_as_image("relationship_graph")
-        
+
+        with acquire_fig((10, 8)) as fig:
+            ax = fig.add_subplot(111)
+            if _HAVE_SCIPY and G.number_of_nodes() > 40:
+                # Spectral seed + short force-directed polish is much
+                # cheaper than 50 Fruchterman-Reingold iterations from
+                # random positions on larger graphs
+                pos = nx.spectral_layout(G)
+                pos = nx.spring_layout(G, pos=pos, k=2, iterations=20)
+            else:
+                pos = nx.spring_layout(G, k=2, iterations=50)
+            nx.draw_networkx_nodes(G, pos, ax=ax, node_color='lightblue', node_size=node_size, alpha=0.8)
+            nx.draw_networkx_edges(G, pos, ax=ax, edge_color='gray', arrows=True, arrowsize=20, arrowstyle='->')
+            nx.draw_networkx_labels(G, pos, ax=ax, font_size=font_size, font_weight='bold')
+
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            ax.set_axis_off()
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating relationship graph: {str(e)}")
 
 @mcp.tool()
 async def create_scatter_plot(
-    x_data: List[float],
-    y_data: List[float],
+    x_data: Optional[List[float]] = None,
+    y_data: Optional[List[float]] = None,
     labels: Optional[List[str]] = None,
     colors: Optional[List[str]] = None,
     title: str = "Scatter Plot",
     x_label: str = "X-axis",
     y_label: str = "Y-axis",
-    size: int = 50
+    size: int = 50,
+    x_data_b64: Optional[str] = None,
+    y_data_b64: Optional[str] = None
 ) -> Image:
-    """Create a scatter plot."""
+    """Create a scatter plot.
+
+    Coordinates may alternatively be passed as base64-encoded
+    little-endian float32 buffers via x_data_b64/y_data_b64.
+    """
+    return await _render(_create_scatter_plot, x_data, y_data, labels, colors,
+                         title, x_label, y_label, size, x_data_b64, y_data_b64)
+
+
+def _create_scatter_plot(x_data, y_data, labels, colors, title, x_label, y_label,
+                         size, x_data_b64, y_data_b64) -> Image:
     try:
-        plt.figure(figsize=(10, 8))
-        if colors is None:
-            colors = ['blue'] * len(x_data)
-        
-        scatter = plt.scatter(x_data, y_data, c=colors, s=size, alpha=0.7, edgecolors='black', linewidth=0.5)
-        
-        if labels:
-            for i, label in enumerate(labels):
-                if i < len(x_data) and i < len(y_data):
-                    plt.annotate(label, (x_data[i], y_data[i]), 
-                                 xytext=(5, 5), textcoords='offset points',
-                                 fontsize=10, alpha=0.8)
-        
-        plt.xlabel(x_label, fontsize=12)
-        plt.ylabel(y_label, fontsize=12)
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        return get_plot_as_image("scatter_plot")
-        
+        # Convert once to a contiguous array so matplotlib skips its own
+        # repeated list -> array conversions
+        x = _decode_or_convert(x_data, x_data_b64, "x_data")
+        y = _decode_or_convert(y_data, y_data_b64, "y_data")
+
+        if x.size > _MAX_POINTS:
+            idx = np.sort(np.random.default_rng(0).choice(x.size, _MAX_POINTS, replace=False))
+            if labels:
+                if len(labels) == x.size:
+                    labels = [labels[i] for i in idx]
+                else:
+                    # A partial labels list pairs label i with point i;
+                    # after subsampling that pairing no longer holds, so
+                    # drop the labels rather than attach them to
+                    # arbitrary surviving points
+                    warnings.warn("Dropping point labels: label count does not "
+                                  "match point count after subsampling")
+                    labels = None
+            if colors is not None and len(colors) == x.size:
+                colors = [colors[i] for i in idx]
+            x = x[idx]
+            y = y[idx]
+
+        with acquire_fig((10, 8)) as fig:
+            ax = fig.add_subplot(111)
+            if colors is None:
+                colors = ['blue'] * x.size
+
+            scatter = ax.scatter(x, y, c=colors, s=size, alpha=0.7, edgecolors='black', linewidth=0.5)
+
+            if labels:
+                n = min(len(labels), x.size, y.size)
+                if n > 200:
+                    # Each annotation is a separate Text artist; past a
+                    # couple hundred they overlap into noise while still
+                    # costing seconds of layout and draw time
+                    warnings.warn(f"Suppressing {n} point labels (limit is 200)")
+                else:
+                    for label, xi, yi in zip(labels[:n], x[:n], y[:n]):
+                        ax.annotate(label, (xi, yi),
+                                    xytext=(5, 5), textcoords='offset points',
+                                    fontsize=10, alpha=0.8)
+
+            ax.set_xlabel(x_label, fontsize=12)
+            ax.set_ylabel(y_label, fontsize=12)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating scatter plot: {str(e)}")
 
 @mcp.tool()
 async def create_3d_plot(
-    x_data: List[float],
-    y_data: List[float],
-    z_data: List[float],
+    x_data: Optional[List[float]] = None,
+    y_data: Optional[List[float]] = None,
+    z_data: Optional[List[float]] = None,
     plot_type: str = "scatter",
     title: str = "3D Plot",
     x_label: str = "X-axis",
     y_label: str = "Y-axis",
-    z_label: str = "Z-axis"
+    z_label: str = "Z-axis",
+    x_data_b64: Optional[str] = None,
+    y_data_b64: Optional[str] = None,
+    z_data_b64: Optional[str] = None
 ) -> Image:
-    """Create a 3D plot (scatter, surface, or wireframe)."""
+    """Create a 3D plot (scatter, surface, or wireframe).
+
+    Coordinates may alternatively be passed as base64-encoded
+    little-endian float32 buffers via the *_b64 parameters.
+    """
+    return await _render(_create_3d_plot, x_data, y_data, z_data, plot_type,
+                         title, x_label, y_label, z_label,
+                         x_data_b64, y_data_b64, z_data_b64)
+
+
+def _create_3d_plot(x_data, y_data, z_data, plot_type, title, x_label, y_label, z_label,
+                    x_data_b64, y_data_b64, z_data_b64) -> Image:
     try:
-        fig = plt.figure(figsize=(12, 9))
-        ax = fig.add_subplot(111, projection='3d')
-        
-        if plot_type == "scatter":
-            ax.scatter(x_data, y_data, z_data, c=z_data, cmap='viridis', s=50)
-            
-        elif plot_type == "surface":
-            x_array = np.array(x_data)
-            y_array = np.array(y_data)
-            z_array = np.array(z_data)
-            unique_x = sorted(set(x_data))
-            unique_y = sorted(set(y_data))
-            
-            if len(unique_x) * len(unique_y) == len(z_data):
-                X = np.array(unique_x)
-                Y = np.array(unique_y)
-                X, Y = np.meshgrid(X, Y)
-                Z = np.array(z_data).reshape(len(unique_y), len(unique_x))
-                ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8)
-            else:
-                ax.scatter(x_data, y_data, z_data, c=z_data, cmap='viridis', s=50)
-                
-        elif plot_type == "wireframe":
-            unique_x = sorted(set(x_data))
-            unique_y = sorted(set(y_data))
-            if len(unique_x) * len(unique_y) == len(z_data):
-                X = np.array(unique_x)
-                Y = np.array(unique_y)
-                X, Y = np.meshgrid(X, Y)
-                Z = np.array(z_data).reshape(len(unique_y), len(unique_x))
-                ax.plot_wireframe(X, Y, Z, alpha=0.8)
-            else:
-                ax.scatter(x_data, y_data, z_data, c=z_data, cmap='viridis', s=50)
-        
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
-        ax.set_zlabel(z_label)
-        ax.set_title(title, fontsize=16, fontweight='bold')
-        
-        return get_plot_as_image("3d_plot")
-        
+        x = _decode_or_convert(x_data, x_data_b64, "x_data")
+        y = _decode_or_convert(y_data, y_data_b64, "y_data")
+        z = _decode_or_convert(z_data, z_data_b64, "z_data")
+
+        with acquire_fig((12, 9)) as fig:
+            ax = fig.add_subplot(111, projection='3d')
+
+            if plot_type == "scatter":
+                ax.scatter(x, y, z, c=z, cmap='viridis', s=50)
+
+            elif plot_type == "surface":
+                # C-level sort + dedupe instead of sorted(set(...)) on lists
+                ux = np.unique(x)
+                uy = np.unique(y)
+
+                if ux.size * uy.size == z.size:
+                    # sparse=True yields broadcastable views instead of
+                    # two dense 2D grids; rcount/ccount cap the polygon
+                    # budget at what is actually visible
+                    X, Y = np.meshgrid(ux, uy, sparse=True)
+                    Z = z.reshape(uy.size, ux.size)
+                    ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8,
+                                    rcount=min(50, uy.size), ccount=min(50, ux.size),
+                                    antialiased=False)
+                else:
+                    ax.scatter(x, y, z, c=z, cmap='viridis', s=50)
+
+            elif plot_type == "wireframe":
+                ux = np.unique(x)
+                uy = np.unique(y)
+                if ux.size * uy.size == z.size:
+                    X, Y = np.meshgrid(ux, uy)
+                    Z = z.reshape(uy.size, ux.size)
+                    ax.plot_wireframe(X, Y, Z, alpha=0.8)
+                else:
+                    ax.scatter(x, y, z, c=z, cmap='viridis', s=50)
+
+            ax.set_xlabel(x_label)
+            ax.set_ylabel(y_label)
+            ax.set_zlabel(z_label)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating 3D plot: {str(e)}")
 
 @mcp.tool()
@@ -167,29 +422,44 @@ async def create_classification_plot(
     y_label: str = "Feature 2"
 ) -> Image:
     """Create a scatter plot with classification categories."""
+    return await _render(_create_classification_plot, x_data, y_data, categories,
+                         title, x_label, y_label)
+
+
+def _create_classification_plot(x_data, y_data, categories, title, x_label, y_label) -> Image:
     try:
-        plt.figure(figsize=(10, 8))
-        unique_categories = list(set(categories))
-        colors = plt.cm.Set1(np.linspace(0, 1, len(unique_categories)))
-        
-        for i, category in enumerate(unique_categories):
-            mask = [cat == category for cat in categories]
-            x_cat = [x for x, m in zip(x_data, mask) if m]
-            y_cat = [y for y, m in zip(y_data, mask) if m]
-            plt.scatter(x_cat, y_cat, c=[colors[i]], label=category, 
-                        s=60, alpha=0.7, edgecolors='black', linewidth=0.5)
-        
-        plt.xlabel(x_label, fontsize=12)
-        plt.ylabel(y_label, fontsize=12)
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        return get_plot_as_image("classification_plot")
-        
+        with acquire_fig((10, 8)) as fig:
+            ax = fig.add_subplot(111)
+            x = np.ascontiguousarray(x_data, dtype=np.float64)
+            y = np.ascontiguousarray(y_data, dtype=np.float64)
+            cats = np.asarray(categories)
+
+            if x.size > _MAX_POINTS:
+                idx = np.random.default_rng(0).choice(x.size, _MAX_POINTS, replace=False)
+                x = x[idx]
+                y = y[idx]
+                cats = cats[idx]
+
+            unique_categories, inverse = np.unique(cats, return_inverse=True)
+            colors = _palette('Set1', len(unique_categories))
+
+            # One scatter call / one PathCollection for all categories;
+            # the legend is built from proxy artists
+            ax.scatter(x, y, c=inverse, cmap=ListedColormap(colors),
+                       s=60, alpha=0.7, edgecolors='black', linewidth=0.5)
+            handles = [Line2D([0], [0], marker='o', linestyle='', color=colors[i],
+                              markeredgecolor='black', markeredgewidth=0.5, label=category)
+                       for i, category in enumerate(unique_categories)]
+
+            ax.set_xlabel(x_label, fontsize=12)
+            ax.set_ylabel(y_label, fontsize=12)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+            ax.grid(True, alpha=0.3)
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating classification plot: {str(e)}")
 
 @mcp.tool()
@@ -201,73 +471,135 @@ async def create_histogram(
     y_label: str = "Frequency"
 ) -> Image:
     """Create a histogram."""
+    return await _render(_create_histogram, data, bins, title, x_label, y_label)
+
+
+def _create_histogram(data, bins, title, x_label, y_label) -> Image:
     try:
-        plt.figure(figsize=(10, 6))
-        plt.hist(data, bins=bins, alpha=0.7, color='skyblue', edgecolor='black', linewidth=0.5)
-        plt.xlabel(x_label, fontsize=12)
-        plt.ylabel(y_label, fontsize=12)
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        
-        return get_plot_as_image("histogram")
-        
+        arr = np.ascontiguousarray(data, dtype=np.float64)
+
+        # Bin in numpy and draw the bars directly - ax.hist would redo
+        # the array conversion and binning inside matplotlib
+        counts, edges = np.histogram(arr, bins=bins)
+
+        with acquire_fig((10, 6)) as fig:
+            ax = fig.add_subplot(111)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                   alpha=0.7, color='skyblue', edgecolor='black', linewidth=0.5)
+            ax.set_xlabel(x_label, fontsize=12)
+            ax.set_ylabel(y_label, fontsize=12)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            ax.grid(True, alpha=0.3, axis='y')
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating histogram: {str(e)}")
 
 @mcp.tool()
 async def create_line_plot(
-    x_data: List[float],
-    y_data: List[float],
+    x_data: Optional[List[float]] = None,
+    y_data: Optional[List[float]] = None,
     title: str = "Line Chart",
     x_label: str = "X-axis",
     y_label: str = "Y-axis",
     line_style: str = "-",
-    color: str = "blue"
+    color: str = "blue",
+    x_data_b64: Optional[str] = None,
+    y_data_b64: Optional[str] = None
 ) -> Image:
-    """Create a line chart."""
+    """Create a line chart.
+
+    Coordinates may alternatively be passed as base64-encoded
+    little-endian float32 buffers via x_data_b64/y_data_b64.
+    """
+    return await _render(_create_line_plot, x_data, y_data, title, x_label,
+                         y_label, line_style, color, x_data_b64, y_data_b64)
+
+
+def _create_line_plot(x_data, y_data, title, x_label, y_label, line_style, color,
+                      x_data_b64, y_data_b64) -> Image:
     try:
-        plt.figure(figsize=(10, 6))
-        plt.plot(x_data, y_data, linestyle=line_style, color=color, linewidth=2, marker='o', markersize=4)
-        plt.xlabel(x_label, fontsize=12)
-        plt.ylabel(y_label, fontsize=12)
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        return get_plot_as_image("line_plot")
-        
+        x = _decode_or_convert(x_data, x_data_b64, "x_data")
+        y = _decode_or_convert(y_data, y_data_b64, "y_data")
+
+        with acquire_fig((10, 6)) as fig:
+            ax = fig.add_subplot(111)
+            ax.plot(x, y, linestyle=line_style, color=color, linewidth=2, marker='o', markersize=4)
+            ax.set_xlabel(x_label, fontsize=12)
+            ax.set_ylabel(y_label, fontsize=12)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating line chart: {str(e)}")
 
 @mcp.tool()
 async def create_heatmap(
-    data: List[List[float]],
+    data: Optional[List[List[float]]] = None,
     x_labels: Optional[List[str]] = None,
     y_labels: Optional[List[str]] = None,
     title: str = "Heatmap",
-    colormap: str = "viridis"
+    colormap: str = "viridis",
+    data_b64: Optional[str] = None,
+    data_cols: Optional[int] = None
 ) -> Image:
-    """Create a heatmap from 2D data."""
+    """Create a heatmap from 2D data.
+
+    The matrix may alternatively be passed as a base64-encoded
+    little-endian float32 buffer via data_b64, row-major with data_cols
+    values per row.
+    """
+    return await _render(_create_heatmap, data, x_labels, y_labels, title,
+                         colormap, data_b64, data_cols)
+
+
+def _create_heatmap(data, x_labels, y_labels, title, colormap, data_b64, data_cols) -> Image:
     try:
-        plt.figure(figsize=(10, 8))
-        im = plt.imshow(data, cmap=colormap, aspect='auto')
-        
-        if x_labels:
-            plt.xticks(range(len(x_labels)), x_labels, rotation=45, ha='right')
-        if y_labels:
-            plt.yticks(range(len(y_labels)), y_labels)
-        
-        plt.colorbar(im, shrink=0.8)
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        
-        return get_plot_as_image("heatmap")
-        
+        if data_b64 is not None:
+            if not data_cols:
+                raise ValueError("data_cols is required when passing data_b64")
+            arr = _decode_or_convert(None, data_b64, "data").reshape(-1, data_cols)
+        elif data is None:
+            raise ValueError("data or data_b64 is required")
+        else:
+            # float32 is plenty for display and halves the memory traffic
+            arr = np.ascontiguousarray(data, dtype=np.float32)
+
+        # Apply the colormap once up front; imshow then takes its fast
+        # uint8 RGBA path instead of normalizing float data on every draw
+        norm = Normalize(vmin=float(arr.min()), vmax=float(arr.max()))
+        rgba = (matplotlib.colormaps[colormap](norm(arr)) * 255).astype(np.uint8)
+
+        # With no labels and the default title, the figure adds nothing
+        # beyond the raster itself - encode the colormapped array directly
+        # and skip the axes/ticks/colorbar machinery entirely. Only do so
+        # when the matrix is large enough that its raw pixels make a
+        # legible image; a small matrix would come back a few pixels wide,
+        # so it keeps the normal figure rendering.
+        if (not x_labels and not y_labels and title == "Heatmap"
+                and rgba.shape[0] >= 200 and rgba.shape[1] >= 200):
+            return Image(data=_encode_png(rgba), format="png")
+
+        with acquire_fig((10, 8)) as fig:
+            ax = fig.add_subplot(111)
+            ax.imshow(rgba, aspect='auto', interpolation='nearest')
+
+            if x_labels:
+                ax.set_xticks(range(len(x_labels)))
+                ax.set_xticklabels(x_labels, rotation=45, ha='right')
+            if y_labels:
+                ax.set_yticks(range(len(y_labels)))
+                ax.set_yticklabels(y_labels)
+
+            fig.colorbar(ScalarMappable(norm=norm, cmap=colormap), ax=ax, shrink=0.8)
+            ax.set_title(title, fontsize=16, fontweight='bold')
+
+            return get_plot_as_image(fig)
+
     except Exception as e:
-        plt.close()
         raise Exception(f"Error creating heatmap: {str(e)}")
 
 def main():